@@ -116,7 +116,8 @@ class FlightTicketTransformer:
             first_leg, last_leg = self.extract_flight_legs(offer)
             if not first_leg or not last_leg:
                 logging.warning(
-                    f"Failed to extract flight legs from offer {offer.get('id', 'unknown')}"
+                    "Failed to extract flight legs from offer %s",
+                    offer.get("id", "unknown"),
                 )
                 return None
 
@@ -132,17 +133,19 @@ class FlightTicketTransformer:
             }
 
             logging.debug(
-                f"Successfully transformed offer {offer.get('id')} to ticket record"
+                "Successfully transformed offer %s to ticket record", offer.get("id")
             )
             return record
 
         except DataValidationError as e:
             logging.warning(
-                f"Data validation failed for offer {offer.get('id', 'unknown')}: {e}"
+                "Data validation failed for offer %s: %s", offer.get("id", "unknown"), e
             )
             return None
         except Exception as e:
-            logging.error(f"Error transforming offer {offer.get('id', 'unknown')}: {e}")
+            logging.error(
+                "Error transforming offer %s: %s", offer.get("id", "unknown"), e
+            )
             return None
 
     def transform_amadeus_offers_batch(
@@ -170,11 +173,13 @@ class FlightTicketTransformer:
                     transformed_records.append(record)
                     successful_transformations += 1
             except Exception as e:
-                logging.error(f"Error transforming offer: {offer}\n{e}")
+                logging.error("Error transforming offer: %s\n%s", offer, e)
                 continue
 
         logging.info(
-            f"Successfully transformed {successful_transformations} out of {len(offers)} offers"
+            "Successfully transformed %d out of %d offers",
+            successful_transformations,
+            len(offers),
         )
         return transformed_records
 
@@ -88,7 +88,9 @@ class FlightTicketDatabaseHandler:
         """
         try:
             connection.execute(text(insert_query), record)
-            logging.info(f"Successfully inserted/updated record: {record}")
+            # Per-record detail only at DEBUG; bulk_insert_flight_tickets logs
+            # the batch summary
+            logging.debug("Successfully inserted/updated record: %s", record)
         except SQLAlchemyError as e:
             error_msg = f"Failed to insert record {record}: {e}"
             logging.error(error_msg)
@@ -123,12 +125,14 @@ class FlightTicketDatabaseHandler:
                         self.insert_flight_ticket(conn, record)
                         successful_inserts += 1
                     except DatabaseError as e:
-                        logging.error(f"Skipping failed record: {e}")
+                        logging.error("Skipping failed record: %s", e)
                         # Continue with other records instead of failing completely
                         continue
 
                 logging.info(
-                    f"Successfully processed {successful_inserts} out of {len(records)} records"
+                    "Successfully processed %d out of %d records",
+                    successful_inserts,
+                    len(records),
                 )
                 return successful_inserts
 
@@ -130,9 +130,7 @@ def ticket_data_ingestion():
                 send_alert(error_msg, "ERROR")
                 log_and_raise(error_msg, error_type=AmadeusAPIError)
             data = resp.json().get("data", [])
-            logging.info(f"Fetched {len(data)} flight offers from Amadeus.")
-
-            logging.info(f"Fetched {len(data)} flight offers from Amadeus.")
+            logging.info("Fetched %d flight offers from Amadeus.", len(data))
             return data
         except Exception as e:
             error_msg = f"Exception in fetch_ticket_data: {str(e)}"
@@ -4,6 +4,8 @@ from fastapi import Depends, HTTPException
 
 from app.api.auth import fastapi_users
 from app.core.models import User
+from app.service.preference import PreferenceService, preference_service
+from app.service.ticket import TicketService, ticket_service
 
 # Authentication dependencies
 current_user = fastapi_users.current_user(active=True)
@@ -30,3 +32,13 @@ def require_superuser(current_user: User = Depends(current_user)) -> User:
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="Superuser privileges required")
     return current_user
+
+
+def get_preference_service() -> PreferenceService:
+    """Dependency returning the shared preference service."""
+    return preference_service
+
+
+def get_ticket_service() -> TicketService:
+    """Dependency returning the shared ticket service."""
+    return ticket_service
@@ -1,9 +1,15 @@
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import current_user, get_user_or_superuser
+from app.api.dependencies import (
+    current_user,
+    get_preference_service,
+    get_user_or_superuser,
+)
 from app.core.models import User
+from app.db.session import get_session
 from app.dto.common import SuccessResponseDTO
 from app.dto.preference import (
     PreferenceRequestDTO,
@@ -13,13 +19,17 @@ from app.dto.preference import (
 from app.service.preference import PreferenceService
 
 router = APIRouter()
-preference_service = PreferenceService()
 
 
 @router.get("/{preference_id}", response_model=PreferenceResponseDTO)
-async def get_preference(preference_id: int, user: User = Depends(current_user)):
+async def get_preference(
+    preference_id: int,
+    user: User = Depends(current_user),
+    service: PreferenceService = Depends(get_preference_service),
+    session: AsyncSession = Depends(get_session),
+):
     """Get a specific preference by ID. Requires authentication."""
-    preference = await preference_service.get_preference(preference_id)
+    preference = await service.get_preference(preference_id, session=session)
     if not preference:
         raise HTTPException(status_code=404, detail="Preference not found")
 
@@ -31,13 +41,18 @@ async def get_preference(preference_id: int, user: User = Depends(current_user))
 
 
 @router.get("/user/{user_id}", response_model=PreferenceResponseDTO)
-async def get_user_preference(user_id: UUID, user: User = Depends(current_user)):
+async def get_user_preference(
+    user_id: UUID,
+    user: User = Depends(current_user),
+    service: PreferenceService = Depends(get_preference_service),
+    session: AsyncSession = Depends(get_session),
+):
     """Get preference for a specific user. Requires authentication."""
     # Users can only see their own preferences unless they're superuser
     if user_id != user.id and not user.is_superuser:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    preference = await preference_service.get_user_preference(user_id)
+    preference = await service.get_user_preference(user_id, session=session)
     if not preference:
         raise HTTPException(status_code=404, detail="User preference not found")
 
@@ -46,7 +61,10 @@ async def get_user_preference(user_id: UUID, user: User = Depends(current_user))
 
 @router.post("/", response_model=PreferenceResponseDTO)
 async def create_preference(
-    preference_data: PreferenceRequestDTO, user: User = Depends(current_user)
+    preference_data: PreferenceRequestDTO,
+    user: User = Depends(current_user),
+    service: PreferenceService = Depends(get_preference_service),
+    session: AsyncSession = Depends(get_session),
 ):
     """Create a new preference. Requires authentication."""
     # Users can only create preferences for themselves unless they're superuser
@@ -55,9 +73,7 @@ async def create_preference(
             status_code=403, detail="Can only create preferences for yourself"
         )
 
-    preference = await preference_service.create_preference(
-        preference_data.model_dump()
-    )
+    preference = await service.create_preference(preference_data, session=session)
     return PreferenceResponseDTO.model_validate(preference)
 
 
@@ -66,10 +82,12 @@ async def update_preference(
     preference_id: int,
     preference_data: PreferenceUpdateDTO,
     user: User = Depends(current_user),
+    service: PreferenceService = Depends(get_preference_service),
+    session: AsyncSession = Depends(get_session),
 ):
     """Update a preference. Requires authentication."""
     # Check if preference exists and user has permission
-    existing_preference = await preference_service.get_preference(preference_id)
+    existing_preference = await service.get_preference(preference_id, session=session)
     if not existing_preference:
         raise HTTPException(status_code=404, detail="Preference not found")
 
@@ -78,8 +96,8 @@ async def update_preference(
             status_code=403, detail="Can only update your own preferences"
         )
 
-    preference = await preference_service.update_preference(
-        preference_id, preference_data.model_dump(exclude_unset=True)
+    preference = await service.update_preference(
+        preference_id, preference_data.model_dump(exclude_unset=True), session=session
     )
     if not preference:
         raise HTTPException(status_code=404, detail="Preference not found")
@@ -92,19 +110,26 @@ async def create_or_update_user_preference(
     user_id: UUID,
     preference_data: PreferenceUpdateDTO,
     user: User = Depends(get_user_or_superuser),
+    service: PreferenceService = Depends(get_preference_service),
+    session: AsyncSession = Depends(get_session),
 ):
     """Create or update preference for a user. Requires authentication."""
-    preference = await preference_service.create_or_update_user_preference(
-        user_id, preference_data.model_dump(exclude_unset=True)
+    preference = await service.create_or_update_user_preference(
+        user_id, preference_data.model_dump(exclude_unset=True), session=session
     )
     return PreferenceResponseDTO.model_validate(preference)
 
 
 @router.delete("/{preference_id}", response_model=SuccessResponseDTO)
-async def delete_preference(preference_id: int, user: User = Depends(current_user)):
+async def delete_preference(
+    preference_id: int,
+    user: User = Depends(current_user),
+    service: PreferenceService = Depends(get_preference_service),
+    session: AsyncSession = Depends(get_session),
+):
     """Delete a preference. Requires authentication."""
     # Check if preference exists and user has permission
-    existing_preference = await preference_service.get_preference(preference_id)
+    existing_preference = await service.get_preference(preference_id, session=session)
     if not existing_preference:
         raise HTTPException(status_code=404, detail="Preference not found")
 
@@ -113,7 +138,7 @@ async def delete_preference(preference_id: int, user: User = Depends(current_use
             status_code=403, detail="Can only delete your own preferences"
         )
 
-    success = await preference_service.delete_preference(preference_id)
+    success = await service.delete_preference(preference_id, session=session)
     if not success:
         raise HTTPException(status_code=404, detail="Preference not found")
 
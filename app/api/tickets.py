@@ -1,33 +1,79 @@
-from typing import List
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import current_user, get_user_or_superuser
+from app.api.dependencies import current_user, get_ticket_service, get_user_or_superuser
 from app.core.models import User
+from app.db.session import get_session
 from app.dto.common import SuccessResponseDTO
 from app.dto.ticket import TicketRequestDTO, TicketResponseDTO, TicketUpdateDTO
 from app.service.ticket import TicketService
 
 router = APIRouter()
-ticket_service = TicketService()
+
+# Built once at import time; validates a whole result list in one call
+ticket_list_adapter = TypeAdapter(List[TicketResponseDTO])
+
+# Tickets encoded per chunk of a streamed JSON array
+STREAM_CHUNK_SIZE = 200
+
+
+async def _stream_json_array(
+    tickets: AsyncIterator, chunk_size: int
+) -> AsyncIterator[bytes]:
+    """Encode streamed tickets as one JSON array, chunk_size tickets per chunk."""
+    yield b"["
+    batch = []
+    separator = b""
+    async for ticket in tickets:
+        batch.append(
+            orjson.dumps(TicketResponseDTO.model_validate(ticket).model_dump())
+        )
+        if len(batch) >= chunk_size:
+            yield separator + b",".join(batch)
+            batch = []
+            separator = b","
+    if batch:
+        yield separator + b",".join(batch)
+    yield b"]"
 
 
 @router.get("/", response_model=List[TicketResponseDTO])
 async def get_tickets(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(
+        None, description="Return tickets with an ID greater than this one"
+    ),
     user: User = Depends(current_user),
+    service: TicketService = Depends(get_ticket_service),
+    session: AsyncSession = Depends(get_session),
 ):
-    """Get all tickets with pagination. Requires authentication."""
-    tickets = await ticket_service.get_tickets(skip=skip, limit=limit)
-    return [TicketResponseDTO.model_validate(ticket) for ticket in tickets]
+    """
+    Get all tickets with pagination. Requires authentication.
+
+    Prefer after_id (the last ID of the previous page) over skip for deep pages.
+    """
+    tickets = await service.get_tickets(
+        skip=skip, limit=limit, after_id=after_id, session=session
+    )
+    return ticket_list_adapter.validate_python(tickets, from_attributes=True)
 
 
 @router.get("/{ticket_id}", response_model=TicketResponseDTO)
-async def get_ticket(ticket_id: int, user: User = Depends(current_user)):
+async def get_ticket(
+    ticket_id: int,
+    user: User = Depends(current_user),
+    service: TicketService = Depends(get_ticket_service),
+    session: AsyncSession = Depends(get_session),
+):
     """Get a specific ticket by ID. Requires authentication."""
-    ticket = await ticket_service.get_ticket(ticket_id)
+    ticket = await service.get_ticket(ticket_id, session=session)
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
@@ -39,24 +85,41 @@ async def get_ticket(ticket_id: int, user: User = Depends(current_user)):
 
 
 @router.get("/user/{user_id}", response_model=List[TicketResponseDTO])
-async def get_user_tickets(user_id: UUID, user: User = Depends(get_user_or_superuser)):
+async def get_user_tickets(
+    user_id: UUID,
+    user: User = Depends(get_user_or_superuser),
+    service: TicketService = Depends(get_ticket_service),
+    session: AsyncSession = Depends(get_session),
+):
     """Get all tickets for a specific user. Requires authentication."""
-    tickets = await ticket_service.get_user_tickets(user_id)
-    return [TicketResponseDTO.model_validate(ticket) for ticket in tickets]
+    tickets = await service.get_user_tickets(user_id, session=session)
+    return ticket_list_adapter.validate_python(tickets, from_attributes=True)
 
 
 @router.get("/destination/{destination}", response_model=List[TicketResponseDTO])
 async def get_tickets_by_destination(
-    destination: str, user: User = Depends(current_user)
+    destination: str,
+    user: User = Depends(current_user),
+    service: TicketService = Depends(get_ticket_service),
 ):
-    """Get tickets by destination. Requires authentication."""
-    tickets = await ticket_service.get_tickets_by_destination(destination)
-    return [TicketResponseDTO.model_validate(ticket) for ticket in tickets]
+    """
+    Get tickets by destination. Requires authentication.
+
+    Results are streamed, so the tickets use their own session rather than the
+    request's one (which is closed before the body is sent).
+    """
+    tickets = service.stream_tickets_by_destination(destination)
+    return StreamingResponse(
+        _stream_json_array(tickets, STREAM_CHUNK_SIZE), media_type="application/json"
+    )
 
 
 @router.post("/", response_model=TicketResponseDTO)
 async def create_ticket(
-    ticket_data: TicketRequestDTO, user: User = Depends(current_user)
+    ticket_data: TicketRequestDTO,
+    user: User = Depends(current_user),
+    service: TicketService = Depends(get_ticket_service),
+    session: AsyncSession = Depends(get_session),
 ):
     """Create a new ticket. Requires authentication."""
     # Users can only create tickets for themselves unless they're superuser
@@ -65,25 +128,29 @@ async def create_ticket(
             status_code=403, detail="Can only create tickets for yourself"
         )
 
-    ticket = await ticket_service.create_ticket(ticket_data.model_dump())
+    ticket = await service.create_ticket(ticket_data.model_dump(), session=session)
     return TicketResponseDTO.model_validate(ticket)
 
 
 @router.put("/{ticket_id}", response_model=TicketResponseDTO)
 async def update_ticket(
-    ticket_id: int, ticket_data: TicketUpdateDTO, user: User = Depends(current_user)
+    ticket_id: int,
+    ticket_data: TicketUpdateDTO,
+    user: User = Depends(current_user),
+    service: TicketService = Depends(get_ticket_service),
+    session: AsyncSession = Depends(get_session),
 ):
     """Update a ticket. Requires authentication."""
     # Check if ticket exists and user has permission
-    existing_ticket = await ticket_service.get_ticket(ticket_id)
+    existing_ticket = await service.get_ticket(ticket_id, session=session)
     if not existing_ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
     if existing_ticket.user_id != user.id and not user.is_superuser:
         raise HTTPException(status_code=403, detail="Can only update your own tickets")
 
-    ticket = await ticket_service.update_ticket(
-        ticket_id, ticket_data.model_dump(exclude_unset=True)
+    ticket = await service.update_ticket(
+        ticket_id, ticket_data.model_dump(exclude_unset=True), session=session
     )
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -91,17 +158,22 @@ async def update_ticket(
 
 
 @router.delete("/{ticket_id}", response_model=SuccessResponseDTO)
-async def delete_ticket(ticket_id: int, user: User = Depends(current_user)):
+async def delete_ticket(
+    ticket_id: int,
+    user: User = Depends(current_user),
+    service: TicketService = Depends(get_ticket_service),
+    session: AsyncSession = Depends(get_session),
+):
     """Delete a ticket. Requires authentication."""
     # Check if ticket exists and user has permission
-    existing_ticket = await ticket_service.get_ticket(ticket_id)
+    existing_ticket = await service.get_ticket(ticket_id, session=session)
     if not existing_ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
     if existing_ticket.user_id != user.id and not user.is_superuser:
         raise HTTPException(status_code=403, detail="Can only delete your own tickets")
 
-    success = await ticket_service.delete_ticket(ticket_id)
+    success = await service.delete_ticket(ticket_id, session=session)
     if not success:
         raise HTTPException(status_code=404, detail="Ticket not found")
 
@@ -5,7 +5,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi_users_db_sqlalchemy import SQLAlchemyBaseUserTableUUID
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -37,6 +37,12 @@ class Preference(Base):
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Match the TicketRepository lookups (by user, destination, date range)
+        Index("ix_tickets_user_id_departure_time", "user_id", "departure_time"),
+        Index("ix_tickets_destination", "destination"),
+        Index("ix_tickets_departure_time", "departure_time"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"))
@@ -48,4 +54,6 @@ class Ticket(Base):
     seat_number: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    user: Mapped["User"] = relationship("User", back_populates="tickets")
+    # Ticket responses never need the owner; loading it must be explicit
+    # (e.g. selectinload) instead of an implicit per-row SELECT.
+    user: Mapped["User"] = relationship("User", back_populates="tickets", lazy="raise")
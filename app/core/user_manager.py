@@ -3,17 +3,20 @@
 import os
 from uuid import UUID
 
+from fastapi import Depends
 from fastapi_users import BaseUserManager, UUIDIDMixin
 from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models import User
-from app.db.session import get_async_session
+from app.db.session import get_session
 
 SECRET = os.getenv("SECRET", "fallback-secret")
 
 
-async def get_user_db(session: AsyncSession):
+async def get_user_db(session: AsyncSession = Depends(get_session)):
+    # get_session is cached per request, so authentication shares the
+    # endpoint's session instead of checking out a second connection
     yield SQLAlchemyUserDatabase(session, User)
 
 
@@ -25,7 +28,7 @@ class UserManager(UUIDIDMixin, BaseUserManager[User, UUID]):
         super().__init__(user_db)
 
 
-async def get_user_manager():
-    async with get_async_session() as session:
-        async for user_db in get_user_db(session):
-            yield UserManager(user_db)
+async def get_user_manager(
+    user_db: SQLAlchemyUserDatabase = Depends(get_user_db),
+):
+    yield UserManager(user_db)
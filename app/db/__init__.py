@@ -1,15 +1,5 @@
-import os
-
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 
 class Base(DeclarativeBase):
     pass
-
-
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./test.db")
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
-async_session_maker = async_sessionmaker(
-    engine, expire_on_commit=False, class_=AsyncSession
-)
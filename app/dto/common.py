@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -18,5 +20,10 @@ class PaginationQueryDTO(BaseModel):
     limit: int = Field(
         100, ge=1, le=1000, description="Maximum number of items to return"
     )
+    after_id: Optional[int] = Field(
+        None, description="Return items with an ID greater than this (keyset)"
+    )
 
-    model_config = ConfigDict(json_schema_extra={"example": {"skip": 0, "limit": 100}})
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"skip": 0, "limit": 100, "after_id": None}}
+    )
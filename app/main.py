@@ -3,8 +3,9 @@ import os
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import api_router
 from app.db.session import get_db_session_manager, init_db_session_manager
@@ -28,7 +29,7 @@ ENV = os.getenv("ENV", "development")
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown logic"""
     try:
-        init_db_session_manager(DATABASE_URL, echo=True)
+        init_db_session_manager(DATABASE_URL, echo=ENV == "development")
         logger.info("Database session initialized successfully!")
         logger.info("Use 'alembic upgrade head' to apply database migrations.")
         yield
@@ -49,6 +50,7 @@ app = FastAPI(
     title="Travel Recommendation API",
     description="Authentication & User Management with FastAPI-Users.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -61,5 +63,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """Turn unexpected errors into a 500 response.
+
+    Endpoints raise HTTPException for expected failures (404, 403, ...);
+    anything else ends up here instead of being wrapped per endpoint. The
+    exception is re-raised afterwards and logged by the server, so it is not
+    logged again here.
+    """
+    return ORJSONResponse({"detail": "Internal server error"}, status_code=500)
+
+
 # Include API router
 app.include_router(api_router, prefix="/api")
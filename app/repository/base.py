@@ -1,8 +1,11 @@
 from abc import ABC
+from contextlib import asynccontextmanager
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from uuid import UUID
 
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
 from app.db.session import get_db_session_manager
@@ -18,6 +21,7 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
     def __init__(self, model: Type[ModelType]):
         self.model = model
         self._db_manager = None
+        self._async_session_factory = None
 
     @property
     def db_manager(self):
@@ -26,91 +30,153 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType], ABC
             self._db_manager = get_db_session_manager()
         return self._db_manager
 
-    async def get(self, id: Union[int, UUID]) -> Optional[ModelType]:
+    @property
+    def async_session_factory(self) -> async_sessionmaker:
+        """Async session factory, bound once on first use."""
+        if self._async_session_factory is None:
+            self._async_session_factory = self.db_manager.async_session_factory
+        return self._async_session_factory
+
+    @asynccontextmanager
+    async def _session_scope(self, session: Optional[AsyncSession] = None):
+        """Reuse the caller's session, or open one just for this call."""
+        if session is not None:
+            yield session
+        else:
+            async with self.async_session_factory() as own_session:
+                yield own_session
+
+    async def _commit(self, session: AsyncSession, injected: bool) -> None:
+        """Commit a session owned by this call; only flush an injected one."""
+        if injected:
+            await session.flush()
+        else:
+            await session.commit()
+
+    @staticmethod
+    def _to_data(obj_in: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+        """Column values from a dict or a pydantic schema (unset fields omitted)."""
+        if isinstance(obj_in, dict):
+            return obj_in
+        return obj_in.model_dump(exclude_unset=True)
+
+    async def get(
+        self, id: Union[int, UUID], session: Optional[AsyncSession] = None
+    ) -> Optional[ModelType]:
         """Get a single record by ID."""
-        async with self.db_manager.get_async_session() as session:
-            result = await session.get(self.model, id)
-            if result:
-                # Detach from session to prevent lazy loading issues
-                session.expunge(result)
-            return result
-
-    async def get_multi(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
-        """Get multiple records with pagination."""
-        async with self.db_manager.get_async_session() as session:
-            query = select(self.model).offset(skip).limit(limit)
-            result = await session.execute(query)
-            entities = result.scalars().all()
-            # Detach all entities from session
-            for entity in entities:
-                session.expunge(entity)
-            return entities
-
-    async def create(self, obj_in: CreateSchemaType) -> ModelType:
+        async with self._session_scope(session) as db_session:
+            return await db_session.get(self.model, id)
+
+    async def get_multi(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[Union[int, UUID]] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> List[ModelType]:
+        """
+        Get multiple records ordered by ID.
+
+        Pass the last ID of the previous page as after_id for keyset
+        pagination, which stays fast at any depth; skip is kept for
+        offset-based callers.
+        """
+        async with self._session_scope(session) as db_session:
+            query = select(self.model).order_by(self.model.id).limit(limit)
+            if after_id is not None:
+                query = query.where(self.model.id > after_id)
+            elif skip:
+                query = query.offset(skip)
+            result = await db_session.execute(query)
+            return result.scalars().all()
+
+    async def count(
+        self, approximate: bool = False, session: Optional[AsyncSession] = None
+    ) -> int:
+        """
+        Count the records in the table.
+
+        Args:
+            approximate: On PostgreSQL, read the planner's row estimate from
+                pg_class instead of scanning the table (exact elsewhere, and
+                when the table has not been analyzed yet)
+            session: Optional session to run the query in
+        """
+        async with self._session_scope(session) as db_session:
+            if approximate and db_session.bind.dialect.name == "postgresql":
+                estimate = await db_session.scalar(
+                    text(
+                        "SELECT reltuples::bigint FROM pg_class "
+                        "WHERE oid = to_regclass(:table_name)"
+                    ),
+                    {"table_name": self.model.__tablename__},
+                )
+                if estimate is not None and estimate >= 0:
+                    return estimate
+
+            query = select(func.count()).select_from(self.model)
+            return await db_session.scalar(query)
+
+    async def create(
+        self, obj_in: CreateSchemaType, session: Optional[AsyncSession] = None
+    ) -> ModelType:
         """Create a new record."""
-        async with self.db_manager.get_async_session() as session:
-            if isinstance(obj_in, dict):
-                db_obj = self.model(**obj_in)
+        obj_data = self._to_data(obj_in)
+
+        async with self._session_scope(session) as db_session:
+            if db_session.bind.dialect.insert_returning:
+                # INSERT ... RETURNING loads server-generated columns in one trip
+                stmt = insert(self.model).values(**obj_data).returning(self.model)
+                db_obj = (await db_session.execute(stmt)).scalar_one()
             else:
-                obj_data = obj_in.dict() if hasattr(obj_in, "dict") else obj_in.__dict__
                 db_obj = self.model(**obj_data)
+                db_session.add(db_obj)
 
-            session.add(db_obj)
-            await session.commit()
-            await session.refresh(db_obj)
-            # Detach from session
-            session.expunge(db_obj)
+            await self._commit(db_session, injected=session is not None)
             return db_obj
 
     async def update(
-        self, id: Union[int, UUID], obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+        self,
+        id: Union[int, UUID],
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]],
+        session: Optional[AsyncSession] = None,
     ) -> Optional[ModelType]:
         """Update an existing record."""
-        async with self.db_manager.get_async_session() as session:
-            db_obj = await session.get(self.model, id)
+        update_data = self._to_data(obj_in)
+
+        async with self._session_scope(session) as db_session:
+            if not update_data:
+                return await db_session.get(self.model, id)
+
+            if db_session.bind.dialect.update_returning:
+                stmt = (
+                    update(self.model)
+                    .where(self.model.id == id)
+                    .values(**update_data)
+                    .returning(self.model)
+                )
+                db_obj = (await db_session.execute(stmt)).scalar_one_or_none()
+            else:
+                db_obj = await db_session.get(self.model, id)
+                if db_obj:
+                    for field, value in update_data.items():
+                        setattr(db_obj, field, value)
             if not db_obj:
                 return None
 
-            if isinstance(obj_in, dict):
-                update_data = obj_in
-            else:
-                update_data = (
-                    obj_in.dict(exclude_unset=True)
-                    if hasattr(obj_in, "dict")
-                    else obj_in.__dict__
-                )
-
-            for field, value in update_data.items():
-                setattr(db_obj, field, value)
-
-            await session.commit()
-            await session.refresh(db_obj)
-            # Detach from session
-            session.expunge(db_obj)
+            await self._commit(db_session, injected=session is not None)
             return db_obj
 
-    async def delete(self, id: Union[int, UUID]) -> bool:
+    async def delete(
+        self, id: Union[int, UUID], session: Optional[AsyncSession] = None
+    ) -> bool:
         """Delete a record by ID."""
-        async with self.db_manager.get_async_session() as session:
-            db_obj = await session.get(self.model, id)
-            if not db_obj:
+        async with self._session_scope(session) as db_session:
+            result = await db_session.execute(
+                delete(self.model).where(self.model.id == id)
+            )
+            if not result.rowcount:
                 return False
 
-            await session.delete(db_obj)
-            await session.commit()
+            await self._commit(db_session, injected=session is not None)
             return True
-
-    # Helper methods for detaching entities (included for your testing)
-    def _detach_entity(
-        self, session, entity: Optional[ModelType]
-    ) -> Optional[ModelType]:
-        """Detach entity from session to prevent lazy loading issues."""
-        if entity is not None:
-            session.expunge(entity)
-        return entity
-
-    def _detach_entities(self, session, entities: List[ModelType]) -> List[ModelType]:
-        """Detach list of entities from session."""
-        for entity in entities:
-            session.expunge(entity)
-        return entities
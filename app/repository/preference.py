@@ -1,12 +1,18 @@
-from typing import Optional
+from typing import Any, Dict, Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models import Preference
 
 from .base import BaseRepository
 
+# Dialects supporting INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+_UPSERT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
 
 class PreferenceRepository(BaseRepository[Preference, dict, dict]):
     """Repository for Preference model operations."""
@@ -14,9 +20,73 @@ class PreferenceRepository(BaseRepository[Preference, dict, dict]):
     def __init__(self):
         super().__init__(Preference)
 
-    async def get_by_user_id(self, user_id: UUID) -> Optional[Preference]:
+    async def get_by_user_id(
+        self, user_id: UUID, session: Optional[AsyncSession] = None
+    ) -> Optional[Preference]:
         """Get preference for a specific user."""
-        async with self.db_manager.get_async_session() as session:
+        async with self._session_scope(session) as db_session:
             query = select(Preference).where(Preference.user_id == user_id)
-            result = await session.execute(query)
+            result = await db_session.execute(query)
             return result.scalar_one_or_none()
+
+    async def exists_by_user_id(
+        self, user_id: UUID, session: Optional[AsyncSession] = None
+    ) -> Optional[int]:
+        """Return the ID of a user's preference, or None if they have none."""
+        async with self._session_scope(session) as db_session:
+            query = select(Preference.id).where(Preference.user_id == user_id).limit(1)
+            return await db_session.scalar(query)
+
+    async def get_by_user_ids(
+        self, user_ids: Sequence[UUID], session: Optional[AsyncSession] = None
+    ) -> Dict[UUID, Optional[Preference]]:
+        """Get preferences for several users in one query, keyed by user ID."""
+        preferences: Dict[UUID, Optional[Preference]] = dict.fromkeys(user_ids)
+        if not preferences:
+            return preferences
+
+        async with self._session_scope(session) as db_session:
+            query = select(Preference).where(Preference.user_id.in_(list(preferences)))
+            result = await db_session.execute(query)
+            for preference in result.scalars():
+                preferences[preference.user_id] = preference
+        return preferences
+
+    async def upsert_by_user_id(
+        self,
+        user_id: UUID,
+        data: Dict[str, Any],
+        session: Optional[AsyncSession] = None,
+    ) -> Preference:
+        """Create the preference of a user, or update it if one exists."""
+        async with self._session_scope(session) as db_session:
+            dialect_insert = _UPSERT_INSERTS.get(db_session.bind.dialect.name)
+            if dialect_insert is None:
+                existing_id = await self.exists_by_user_id(user_id, session=db_session)
+                if existing_id is not None:
+                    preference = await self.update(
+                        existing_id, data, session=db_session
+                    )
+                else:
+                    preference = await self.create(
+                        {**data, "user_id": user_id}, session=db_session
+                    )
+            else:
+                stmt = dialect_insert(Preference).values(user_id=user_id, **data)
+                stmt = (
+                    stmt.on_conflict_do_update(
+                        index_elements=[Preference.user_id],
+                        # With nothing to change, rewrite user_id so RETURNING
+                        # still yields the existing row
+                        set_={key: stmt.excluded[key] for key in data or ["user_id"]},
+                    )
+                    .returning(Preference)
+                    .execution_options(populate_existing=True)
+                )
+                preference = (await db_session.execute(stmt)).scalar_one()
+
+            await self._commit(db_session, injected=session is not None)
+            return preference
+
+
+preference_repository = PreferenceRepository()
@@ -1,13 +1,17 @@
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models import Ticket
 
 from .base import BaseRepository
 
+# Rows hydrated per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 200
+
 
 class TicketRepository(BaseRepository[Ticket, dict, dict]):
     """Repository for Ticket model operations."""
@@ -15,27 +19,86 @@ class TicketRepository(BaseRepository[Ticket, dict, dict]):
     def __init__(self):
         super().__init__(Ticket)
 
-    async def get_by_user_id(self, user_id: UUID) -> List[Ticket]:
+    async def get_by_user_id(
+        self, user_id: UUID, session: Optional[AsyncSession] = None
+    ) -> List[Ticket]:
         """Get all tickets for a specific user."""
-        async with self.db_manager.get_async_session() as session:
+        async with self._session_scope(session) as db_session:
             query = select(Ticket).where(Ticket.user_id == user_id)
-            result = await session.execute(query)
+            result = await db_session.execute(query)
             return result.scalars().all()
 
-    async def get_by_destination(self, destination: str) -> List[Ticket]:
+    async def get_by_user_ids(
+        self, user_ids: Sequence[UUID], session: Optional[AsyncSession] = None
+    ) -> Dict[UUID, List[Ticket]]:
+        """Get tickets for several users in one query, grouped by user ID."""
+        tickets_by_user: Dict[UUID, List[Ticket]] = {
+            user_id: [] for user_id in user_ids
+        }
+        if not tickets_by_user:
+            return tickets_by_user
+
+        async with self._session_scope(session) as db_session:
+            query = select(Ticket).where(Ticket.user_id.in_(list(tickets_by_user)))
+            result = await db_session.execute(query)
+            for ticket in result.scalars():
+                tickets_by_user[ticket.user_id].append(ticket)
+        return tickets_by_user
+
+    async def get_by_destination(
+        self, destination: str, session: Optional[AsyncSession] = None
+    ) -> List[Ticket]:
         """Get all tickets to a specific destination."""
-        async with self.db_manager.get_async_session() as session:
+        async with self._session_scope(session) as db_session:
             query = select(Ticket).where(Ticket.destination == destination)
-            result = await session.execute(query)
+            result = await db_session.execute(query)
             return result.scalars().all()
 
+    async def stream_by_destination(
+        self, destination: str, session: Optional[AsyncSession] = None
+    ) -> AsyncIterator[Ticket]:
+        """Stream tickets to a specific destination in batches."""
+        query = select(Ticket).where(Ticket.destination == destination)
+        async for ticket in self._stream(query, session):
+            yield ticket
+
     async def get_by_date_range(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        session: Optional[AsyncSession] = None,
     ) -> List[Ticket]:
         """Get tickets within a date range."""
-        async with self.db_manager.get_async_session() as session:
+        async with self._session_scope(session) as db_session:
             query = select(Ticket).where(
                 Ticket.departure_time >= start_date, Ticket.departure_time <= end_date
             )
-            result = await session.execute(query)
+            result = await db_session.execute(query)
             return result.scalars().all()
+
+    async def stream_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        session: Optional[AsyncSession] = None,
+    ) -> AsyncIterator[Ticket]:
+        """Stream tickets within a date range in batches."""
+        query = select(Ticket).where(
+            Ticket.departure_time >= start_date, Ticket.departure_time <= end_date
+        )
+        async for ticket in self._stream(query, session):
+            yield ticket
+
+    async def _stream(
+        self, query: Select, session: Optional[AsyncSession] = None
+    ) -> AsyncIterator[Ticket]:
+        """Yield query results without loading the whole result list."""
+        async with self._session_scope(session) as db_session:
+            result = await db_session.stream_scalars(
+                query.execution_options(yield_per=STREAM_BATCH_SIZE)
+            )
+            async for ticket in result:
+                yield ticket
+
+
+ticket_repository = TicketRepository()
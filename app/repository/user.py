@@ -1,6 +1,7 @@
 from typing import Optional
 
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.models import User
 from app.core.schemas import UserCreate, UserUpdate
@@ -14,11 +15,13 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     def __init__(self):
         super().__init__(User)
 
-    async def get_by_email(self, email: str) -> Optional[User]:
+    async def get_by_email(
+        self, email: str, session: Optional[AsyncSession] = None
+    ) -> Optional[User]:
         """Get user by email address."""
-        async with self.db_manager.get_async_session() as session:
+        async with self._session_scope(session) as db_session:
             query = select(User).where(User.email == email)
-            result = await session.execute(query)
+            result = await db_session.execute(query)
             return result.scalar_one_or_none()
 
     async def get_active_users(self, skip: int = 0, limit: int = 100):
@@ -30,3 +33,6 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         return await self.get_multi(
             skip=skip, limit=limit, filters={"is_verified": True}
         )
+
+
+user_repository = UserRepository()
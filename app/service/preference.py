@@ -1,52 +1,74 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.models import Preference
-from app.repository.preference import PreferenceRepository
+from app.dto.preference import PreferenceRequestDTO
+from app.repository.preference import PreferenceRepository, preference_repository
 
 
 class PreferenceService:
     """Service layer for preference business logic."""
 
-    def __init__(self):
-        self._repository = None
-
     @property
-    def repository(self):
-        """Lazy initialization of preference repository."""
-        if self._repository is None:
-            self._repository = PreferenceRepository()
-        return self._repository
+    def repository(self) -> PreferenceRepository:
+        """Shared preference repository; repositories hold no per-request state."""
+        return preference_repository
 
-    async def get_preference(self, preference_id: int) -> Optional[Preference]:
+    async def get_preference(
+        self, preference_id: int, session: Optional[AsyncSession] = None
+    ) -> Optional[Preference]:
         """Get a preference by ID."""
-        return await self.repository.get(preference_id)
+        return await self.repository.get(preference_id, session=session)
 
-    async def get_user_preference(self, user_id: UUID) -> Optional[Preference]:
+    async def get_user_preference(
+        self, user_id: UUID, session: Optional[AsyncSession] = None
+    ) -> Optional[Preference]:
         """Get preference for a specific user."""
-        return await self.repository.get_by_user_id(user_id)
+        return await self.repository.get_by_user_id(user_id, session=session)
 
-    async def create_preference(self, preference_data: Dict) -> Preference:
-        """Create a new preference."""
-        return await self.repository.create(preference_data)
+    async def get_users_preferences(
+        self, user_ids: Sequence[UUID], session: Optional[AsyncSession] = None
+    ) -> Dict[UUID, Optional[Preference]]:
+        """Get preferences for several users at once, keyed by user ID."""
+        return await self.repository.get_by_user_ids(user_ids, session=session)
+
+    async def create_preference(
+        self,
+        preference_data: PreferenceRequestDTO,
+        session: Optional[AsyncSession] = None,
+    ) -> Preference:
+        """Create a new preference, leaving unset fields to column defaults."""
+        return await self.repository.create(preference_data, session=session)
 
     async def update_preference(
-        self, preference_id: int, preference_data: Dict
+        self,
+        preference_id: int,
+        preference_data: Dict,
+        session: Optional[AsyncSession] = None,
     ) -> Optional[Preference]:
         """Update an existing preference."""
-        return await self.repository.update(preference_id, preference_data)
+        return await self.repository.update(
+            preference_id, preference_data, session=session
+        )
 
-    async def delete_preference(self, preference_id: int) -> bool:
+    async def delete_preference(
+        self, preference_id: int, session: Optional[AsyncSession] = None
+    ) -> bool:
         """Delete a preference."""
-        return await self.repository.delete(preference_id)
+        return await self.repository.delete(preference_id, session=session)
 
     async def create_or_update_user_preference(
-        self, user_id: UUID, preference_data: Dict
+        self,
+        user_id: UUID,
+        preference_data: Dict,
+        session: Optional[AsyncSession] = None,
     ) -> Preference:
-        """Create or update preference for a user."""
-        existing = await self.get_user_preference(user_id)
-        if existing:
-            return await self.update_preference(existing.id, preference_data)
-        else:
-            preference_data["user_id"] = user_id
-            return await self.create_preference(preference_data)
+        """Create or update preference for a user in a single statement."""
+        return await self.repository.upsert_by_user_id(
+            user_id, preference_data, session=session
+        )
+
+
+preference_service = PreferenceService()
@@ -1,60 +1,108 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.models import Ticket
-from app.repository.ticket import TicketRepository
+from app.repository.ticket import TicketRepository, ticket_repository
 
 
 class TicketService:
     """Service layer for ticket business logic."""
 
-    def __init__(self):
-        self._repository = None
-
     @property
-    def repository(self):
-        """Lazy initialization of ticket repository."""
-        if self._repository is None:
-            self._repository = TicketRepository()
-        return self._repository
+    def repository(self) -> TicketRepository:
+        """Shared ticket repository; repositories hold no per-request state."""
+        return ticket_repository
 
-    async def get_ticket(self, ticket_id: int) -> Optional[Ticket]:
+    async def get_ticket(
+        self, ticket_id: int, session: Optional[AsyncSession] = None
+    ) -> Optional[Ticket]:
         """Get a ticket by ID."""
-        return await self.repository.get(ticket_id)
+        return await self.repository.get(ticket_id, session=session)
 
-    async def get_tickets(self, skip: int = 0, limit: int = 100) -> List[Ticket]:
-        """Get tickets with pagination."""
-        return await self.repository.get_multi(skip=skip, limit=limit)
+    async def get_tickets(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> List[Ticket]:
+        """Get tickets with offset or keyset (after_id) pagination."""
+        return await self.repository.get_multi(
+            skip=skip, limit=limit, after_id=after_id, session=session
+        )
 
-    async def get_user_tickets(self, user_id: UUID) -> List[Ticket]:
+    async def get_user_tickets(
+        self, user_id: UUID, session: Optional[AsyncSession] = None
+    ) -> List[Ticket]:
         """Get all tickets for a specific user."""
-        return await self.repository.get_by_user_id(user_id)
+        return await self.repository.get_by_user_id(user_id, session=session)
+
+    async def get_users_tickets(
+        self, user_ids: Sequence[UUID], session: Optional[AsyncSession] = None
+    ) -> Dict[UUID, List[Ticket]]:
+        """Get tickets for several users at once, grouped by user ID."""
+        return await self.repository.get_by_user_ids(user_ids, session=session)
 
-    async def get_tickets_by_destination(self, destination: str) -> List[Ticket]:
+    async def get_tickets_by_destination(
+        self, destination: str, session: Optional[AsyncSession] = None
+    ) -> List[Ticket]:
         """Get tickets by destination."""
-        return await self.repository.get_by_destination(destination)
+        return await self.repository.get_by_destination(destination, session=session)
+
+    def stream_tickets_by_destination(
+        self, destination: str, session: Optional[AsyncSession] = None
+    ) -> AsyncIterator[Ticket]:
+        """Stream tickets by destination without loading them all at once."""
+        return self.repository.stream_by_destination(destination, session=session)
 
     async def get_tickets_by_date_range(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        session: Optional[AsyncSession] = None,
     ) -> List[Ticket]:
         """Get tickets within a date range."""
-        return await self.repository.get_by_date_range(start_date, end_date)
+        return await self.repository.get_by_date_range(
+            start_date, end_date, session=session
+        )
+
+    def stream_tickets_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        session: Optional[AsyncSession] = None,
+    ) -> AsyncIterator[Ticket]:
+        """Stream tickets within a date range without loading them all at once."""
+        return self.repository.stream_by_date_range(
+            start_date, end_date, session=session
+        )
 
-    async def create_ticket(self, ticket_data: Dict) -> Ticket:
+    async def create_ticket(
+        self, ticket_data: Dict, session: Optional[AsyncSession] = None
+    ) -> Ticket:
         """Create a new ticket."""
-        return await self.repository.create(ticket_data)
+        return await self.repository.create(ticket_data, session=session)
 
     async def update_ticket(
-        self, ticket_id: int, ticket_data: Dict
+        self, ticket_id: int, ticket_data: Dict, session: Optional[AsyncSession] = None
     ) -> Optional[Ticket]:
         """Update an existing ticket."""
-        return await self.repository.update(ticket_id, ticket_data)
+        return await self.repository.update(ticket_id, ticket_data, session=session)
 
-    async def delete_ticket(self, ticket_id: int) -> bool:
+    async def delete_ticket(
+        self, ticket_id: int, session: Optional[AsyncSession] = None
+    ) -> bool:
         """Delete a ticket."""
-        return await self.repository.delete(ticket_id)
+        return await self.repository.delete(ticket_id, session=session)
+
+    async def get_ticket_count(
+        self, approximate: bool = False, session: Optional[AsyncSession] = None
+    ) -> int:
+        """Get total ticket count, optionally as a fast estimate."""
+        return await self.repository.count(approximate=approximate, session=session)
+
 
-    async def get_ticket_count(self) -> int:
-        """Get total ticket count."""
-        return await self.repository.count()
+ticket_service = TicketService()
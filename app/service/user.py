@@ -3,21 +3,16 @@ from uuid import UUID
 
 from app.core.models import User
 from app.core.schemas import UserCreate, UserUpdate
-from app.repository.user import UserRepository
+from app.repository.user import UserRepository, user_repository
 
 
 class UserService:
     """Service layer for user business logic."""
 
-    def __init__(self):
-        self._repository = None
-
     @property
-    def repository(self):
-        """Lazy initialization of user repository."""
-        if self._repository is None:
-            self._repository = UserRepository()
-        return self._repository
+    def repository(self) -> UserRepository:
+        """Shared user repository; repositories hold no per-request state."""
+        return user_repository
 
     async def get_user(self, user_id: UUID) -> Optional[User]:
         """Get a user by ID."""
@@ -54,3 +49,6 @@ class UserService:
     async def get_user_count(self) -> int:
         """Get total user count."""
         return await self.repository.count()
+
+
+user_service = UserService()
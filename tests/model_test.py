@@ -2,6 +2,7 @@ from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
@@ -56,3 +57,30 @@ async def test_user_ticket(db_test_session):
     )
     loaded = result.scalar_one()
     assert len(loaded.tickets) == 1
+
+
+@pytest.mark.asyncio
+async def test_ticket_user_is_not_lazy_loaded(db_test_session):
+    user = User(id=uuid4(), email="owner@example.com", hashed_password="hashed")
+    db_test_session.add(user)
+    await db_test_session.flush()
+
+    ticket = Ticket(
+        user_id=user.id,
+        origin="NYC",
+        destination="LAX",
+        departure_time=datetime.now(),
+        arrival_time=datetime.now(),
+    )
+    db_test_session.add(ticket)
+    await db_test_session.commit()
+    db_test_session.expunge_all()
+
+    result = await db_test_session.execute(select(Ticket).where(Ticket.id == ticket.id))
+    with pytest.raises(InvalidRequestError):
+        result.scalar_one().user
+
+    result = await db_test_session.execute(
+        select(Ticket).options(selectinload(Ticket.user)).where(Ticket.id == ticket.id)
+    )
+    assert result.scalar_one().user.email == "owner@example.com"
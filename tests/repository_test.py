@@ -0,0 +1,137 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.core.models import User
+from app.repository.ticket import TicketRepository
+from app.service.preference import PreferenceService
+
+
+async def _create_user(session, email):
+    user = User(id=uuid4(), email=email, hashed_password="hashed")
+    session.add(user)
+    await session.flush()
+    return user
+
+
+def _ticket_data(user_id, day=1, destination="LAX"):
+    return {
+        "user_id": user_id,
+        "origin": "NYC",
+        "destination": destination,
+        "departure_time": datetime(2030, 1, day, 10),
+        "arrival_time": datetime(2030, 1, day, 15),
+    }
+
+
+@pytest.mark.asyncio
+async def test_ticket_crud_with_injected_session(db_test_session):
+    user = await _create_user(db_test_session, "repo@example.com")
+    repository = TicketRepository()
+
+    ticket = await repository.create(_ticket_data(user.id), session=db_test_session)
+    assert ticket.id is not None
+
+    updated = await repository.update(
+        ticket.id, {"seat_number": "12A"}, session=db_test_session
+    )
+    assert updated.seat_number == "12A"
+    assert updated.destination == "LAX"
+
+    tickets = await repository.get_by_user_id(user.id, session=db_test_session)
+    assert [t.id for t in tickets] == [ticket.id]
+
+    assert await repository.delete(ticket.id, session=db_test_session) is True
+    assert await repository.get(ticket.id, session=db_test_session) is None
+    assert await repository.delete(ticket.id, session=db_test_session) is False
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_user_preference(db_test_session):
+    user = await _create_user(db_test_session, "upsert@example.com")
+    service = PreferenceService()
+
+    created = await service.create_or_update_user_preference(
+        user.id, {"prefers_sms": True}, session=db_test_session
+    )
+    assert created.prefers_sms is True
+    assert created.prefers_email is True
+
+    updated = await service.create_or_update_user_preference(
+        user.id, {"prefers_email": False}, session=db_test_session
+    )
+    assert updated.id == created.id
+    assert updated.prefers_email is False
+    assert updated.prefers_sms is True
+
+
+@pytest.mark.asyncio
+async def test_ticket_keyset_pagination(db_test_session):
+    user = await _create_user(db_test_session, "pages@example.com")
+    repository = TicketRepository()
+    for day in range(1, 4):
+        await repository.create(_ticket_data(user.id, day=day), session=db_test_session)
+
+    first_page = await repository.get_multi(limit=2, session=db_test_session)
+    second_page = await repository.get_multi(
+        limit=2, after_id=first_page[-1].id, session=db_test_session
+    )
+    offset_page = await repository.get_multi(skip=2, limit=2, session=db_test_session)
+
+    assert len(first_page) == 2
+    assert [t.id for t in second_page] == [t.id for t in offset_page]
+    assert len(second_page) == 1
+
+
+@pytest.mark.asyncio
+async def test_tickets_for_several_users_in_one_query(db_test_session):
+    alice = await _create_user(db_test_session, "alice@example.com")
+    bob = await _create_user(db_test_session, "bob@example.com")
+    repository = TicketRepository()
+    ticket = await repository.create(_ticket_data(alice.id), session=db_test_session)
+
+    tickets = await repository.get_by_user_ids(
+        [alice.id, bob.id], session=db_test_session
+    )
+
+    assert [t.id for t in tickets[alice.id]] == [ticket.id]
+    assert tickets[bob.id] == []
+
+
+@pytest.mark.asyncio
+async def test_stream_tickets_by_destination_and_date_range(db_test_session):
+    user = await _create_user(db_test_session, "stream@example.com")
+    repository = TicketRepository()
+    for day, destination in enumerate(["LAX", "SFO", "LAX"], start=1):
+        await repository.create(
+            _ticket_data(user.id, day=day, destination=destination),
+            session=db_test_session,
+        )
+
+    by_destination = [
+        t.destination
+        async for t in repository.stream_by_destination("LAX", session=db_test_session)
+    ]
+    by_date = [
+        t.departure_time.day
+        async for t in repository.stream_by_date_range(
+            datetime(2030, 1, 2), datetime(2030, 1, 4), session=db_test_session
+        )
+    ]
+
+    assert by_destination == ["LAX", "LAX"]
+    assert sorted(by_date) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_ticket_count(db_test_session):
+    user = await _create_user(db_test_session, "count@example.com")
+    repository = TicketRepository()
+    assert await repository.count(session=db_test_session) == 0
+
+    await repository.create(_ticket_data(user.id), session=db_test_session)
+
+    assert await repository.count(session=db_test_session) == 1
+    # No pg_class estimate outside PostgreSQL, so this is an exact count too
+    assert await repository.count(approximate=True, session=db_test_session) == 1
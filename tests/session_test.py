@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import NullPool
+
+from app.db.session import UnifiedDatabaseSession
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "database_url", ["sqlite:///:memory:", "sqlite+aiosqlite:///:memory:"]
+)
+async def test_in_memory_sqlite_skips_pool_sizing(database_url):
+    db = UnifiedDatabaseSession(database_url, pool_size=5)
+
+    async with db.get_async_session() as session:
+        assert await session.scalar(text("SELECT 1")) == 1
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_sqlite_sync_engine_skips_pool_sizing():
+    db = UnifiedDatabaseSession("sqlite:///:memory:", pool_size=5)
+
+    with db.get_session() as session:
+        assert session.scalar(text("SELECT 1")) == 1
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_file_sqlite_uses_pool_sizing(tmp_path):
+    db = UnifiedDatabaseSession(f"sqlite:///{tmp_path}/pool.db", pool_size=5)
+
+    assert db.async_engine.pool.size() == 5
+    assert db.sync_engine.pool.size() == 5
+
+    await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_disabled_uses_null_pool():
+    db = UnifiedDatabaseSession("sqlite+aiosqlite:///:memory:", pool_enabled=False)
+
+    assert isinstance(db.async_engine.pool, NullPool)
+
+    await db.dispose()
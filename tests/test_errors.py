@@ -0,0 +1,23 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import unhandled_exception_handler
+
+# A throwaway app with the production handler, so the shared app gets no
+# test-only routes
+error_app = FastAPI()
+error_app.add_exception_handler(Exception, unhandled_exception_handler)
+
+
+@error_app.get("/boom")
+async def boom():
+    raise RuntimeError("boom")
+
+
+client = TestClient(error_app, raise_server_exceptions=False)
+
+
+def test_unhandled_exception_returns_generic_500():
+    response = client.get("/boom")
+    assert response.status_code == 500
+    assert response.json() == {"detail": "Internal server error"}
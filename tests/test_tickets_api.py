@@ -0,0 +1,70 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.api.tickets as tickets_api
+from app.api.dependencies import current_user, get_ticket_service
+from app.core.models import Ticket, User
+from app.main import app
+
+client = TestClient(app)
+
+
+class _StubTicketService:
+    """Serves a fixed ticket list through the streaming service method."""
+
+    def __init__(self, tickets):
+        self.tickets = tickets
+
+    async def _stream(self):
+        for ticket in self.tickets:
+            yield ticket
+
+    def stream_tickets_by_destination(self, destination, session=None):
+        return self._stream()
+
+
+def _ticket(ticket_id, user_id):
+    return Ticket(
+        id=ticket_id,
+        user_id=user_id,
+        origin="NYC",
+        destination="LAX",
+        departure_time=datetime(2030, 1, 1, 10),
+        arrival_time=datetime(2030, 1, 1, 15),
+    )
+
+
+@pytest.fixture
+def stub_tickets():
+    user = User(id=uuid4(), email="stream@example.com", hashed_password="hashed")
+    tickets = []
+    app.dependency_overrides[current_user] = lambda: user
+    app.dependency_overrides[get_ticket_service] = lambda: _StubTicketService(tickets)
+    yield user, tickets
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 5])
+def test_tickets_by_destination_streams_a_json_array(stub_tickets, monkeypatch, count):
+    # Two tickets per chunk, so larger results span several chunks
+    monkeypatch.setattr(tickets_api, "STREAM_CHUNK_SIZE", 2)
+    user, tickets = stub_tickets
+    tickets.extend(_ticket(i, user.id) for i in range(1, count + 1))
+
+    response = client.get("/api/tickets/destination/LAX")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert [ticket["id"] for ticket in body] == list(range(1, count + 1))
+    assert all(ticket["destination"] == "LAX" for ticket in body)
+
+
+def test_tickets_by_destination_empty_result(stub_tickets):
+    response = client.get("/api/tickets/destination/Nowhere")
+
+    assert response.status_code == 200
+    assert response.content == b"[]"